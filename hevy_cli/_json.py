@@ -0,0 +1,50 @@
+"""JSON encoding and decoding through the fastest backend that is installed.
+
+The priority is orjson, then ujson (for platforms without orjson wheels),
+then the stdlib. ``dumps`` always returns UTF-8 bytes, whatever the backend.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0, default=str)
+
+else:
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+    if ujson is not None:
+        loads = ujson.loads
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            return ujson.dumps(
+                obj, indent=2 if indent else 0, ensure_ascii=False, default=str
+            ).encode()
+
+    else:
+        import json
+
+        loads = json.loads
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            return json.dumps(
+                obj,
+                indent=2 if indent else None,
+                separators=None if indent else (",", ":"),
+                ensure_ascii=False,
+                default=str,
+            ).encode()
@@ -0,0 +1,123 @@
+"""On-disk HTTP response cache for conditional GET requests."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    expires REAL NOT NULL
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "hevy-cli"
+
+
+def _max_age(cache_control: str) -> int:
+    m = _MAX_AGE_RE.search(cache_control)
+    return int(m.group(1)) if m else 0
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """Headers to send for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed store of GET response bodies and their validators.
+
+    Entries are keyed per API key and URL, so switching accounts never
+    serves another account's data.
+    """
+
+    def __init__(self, api_key: str, cache_dir: Path | None = None) -> None:
+        cache_dir = cache_dir or default_cache_dir()
+        # Bodies hold the user's private training data: keep them owner-only.
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_dir.chmod(0o700)
+        db_path = cache_dir / "http.sqlite"
+        db_path.touch(mode=0o600, exist_ok=True)
+        db_path.chmod(0o600)
+        self._db = sqlite3.connect(db_path)
+        self._db.execute(_SCHEMA)
+        self._scope = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _key(self, url: str) -> str:
+        return f"{self._scope} {url}"
+
+    def get(self, url: str) -> CachedResponse | None:
+        row = self._db.execute(
+            "SELECT etag, last_modified, body, expires FROM responses WHERE key = ?",
+            (self._key(url),),
+        ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def store(self, url: str, path: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a 200 response if it is cacheable."""
+        cache_control = headers.get("cache-control", "")
+        if "no-store" in cache_control:
+            return
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        max_age = 0 if "no-cache" in cache_control else _max_age(cache_control)
+        if not (etag or last_modified or max_age):
+            return
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(url), path, etag, last_modified, body, time.time() + max_age),
+            )
+
+    def refresh(self, url: str, headers: Mapping[str, str]) -> None:
+        """Extend an entry's freshness after a 304 Not Modified."""
+        max_age = _max_age(headers.get("cache-control", ""))
+        with self._db:
+            self._db.execute(
+                "UPDATE responses SET expires = ? WHERE key = ?",
+                (time.time() + max_age, self._key(url)),
+            )
+
+    def invalidate(self, path: str) -> None:
+        """Drop every entry under ``path`` (e.g. after a write to it)."""
+        prefix = "/".join(path.split("/")[:3])
+        with self._db:
+            self._db.execute(
+                "DELETE FROM responses WHERE path = ? OR path LIKE ?",
+                (prefix, prefix + "/%"),
+            )
@@ -2,93 +2,364 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextlib
+import random
+import sqlite3
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
 
 import httpx
 
+from hevy_cli import _json
+from hevy_cli.cache import ResponseCache
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if TYPE_CHECKING:
+    from hevy_cli.models import WorkoutsPage
+
+# Whether the typed ``*_typed`` fetchers can be used.
+HAS_MSGSPEC = msgspec is not None
+
 BASE_URL = "https://api.hevyapp.com"
 
+# Endpoint paths; id-based endpoints append "/" + id.
+_P_WORKOUTS = "/v1/workouts"
+_P_WORKOUT_COUNT = "/v1/workouts/count"
+_P_WORKOUT_EVENTS = "/v1/workouts/events"
+_P_ROUTINES = "/v1/routines"
+_P_TEMPLATES = "/v1/exercise_templates"
+_P_HISTORY = "/v1/exercise_history"
+_P_FOLDERS = "/v1/routine_folders"
+# Cached reads derived from workouts, dropped along with them on a workout write.
+_WORKOUT_DEPENDENTS = (_P_HISTORY,)
+MAX_CONCURRENCY = 32
+# Page sizes at or above this are read with a streamed request.
+LARGE_PAGE_SIZE = 50
+STREAM_CHUNK_SIZE = 65536
+# Retry policy for rate-limited / temporarily unavailable responses.
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 30.0
+CONNECT_RETRIES = 3
+_RETRY_STATUSES = frozenset({429, 503})
+# A 503 can come from a proxy after the origin already applied a write, so
+# writes are retried only when rate-limited (the request was never handled).
+_WRITE_RETRY_STATUSES = frozenset({429})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _decode(resp: httpx.Response) -> Any:
+    """Decode a JSON response body straight from its raw bytes."""
+    return _json.loads(resp.content)
+
+
+def _header_delay(resp: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait, from Retry-After or X-RateLimit-Reset."""
+    retry_after = resp.headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after).timestamp()
+                return max(0.0, when - time.time())
+            except (TypeError, ValueError):
+                pass
+    reset = resp.headers.get("x-ratelimit-reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        # Either an absolute epoch timestamp or a number of seconds.
+        return max(0.0, value - time.time()) if value > 1e9 else value
+    return None
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    delay = _header_delay(resp)
+    if delay is None:
+        delay = 2**attempt + random.uniform(0, 1)
+    return min(delay, MAX_BACKOFF)
+
+
+def _rate_limit_pause(resp: httpx.Response) -> float:
+    """How long to hold off further requests once the rate-limit budget is spent."""
+    if resp.headers.get("x-ratelimit-remaining") != "0":
+        return 0.0
+    return min(_header_delay(resp) or 0.0, MAX_BACKOFF)
+
 
 class HevyClient:
     """HTTP client for the Hevy API."""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, cache: bool = True) -> None:
+        self._cache: ResponseCache | None = None
+        if cache:
+            try:
+                self._cache = ResponseCache(api_key)
+            except (OSError, sqlite3.Error):
+                pass
+        self._paused_until = 0.0
+        self._raw = False
+        # Per-process memo of idempotent id lookups.
+        self._tpl_cache: dict[str, dict] = {}
+        self._folder_cache: dict[str, dict] = {}
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=32,
+                keepalive_expiry=60.0,
+            ),
+            retries=CONNECT_RETRIES,
+        )
         self._client = httpx.Client(
             base_url=BASE_URL,
             headers={"api-key": api_key},
             timeout=30.0,
+            transport=transport,
         )
 
+    def __enter__(self) -> HevyClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections and the response cache."""
+        self._client.close()
+        self._with_cache(lambda c: c.close())
+
+    @contextlib.contextmanager
+    def raw_bodies(self) -> Iterator[None]:
+        """Within the block, calls return the undecoded JSON response body.
+
+        Lets ``--json-output`` write the API's bytes through unparsed.
+        """
+        self._raw = True
+        try:
+            yield
+        finally:
+            self._raw = False
+
     # -- low-level helpers ---------------------------------------------------
 
+    def _with_cache(self, op: Callable[[ResponseCache], Any]) -> Any:
+        """Apply ``op`` to the cache, if any; returns None when there is none.
+
+        The cache is an optimisation only: on a SQLite error (locked, corrupt,
+        disk full) it is switched off for the rest of the process and the
+        request goes ahead uncached.
+        """
+        cache = self._cache
+        if cache is None:
+            return None
+        try:
+            return op(cache)
+        except sqlite3.Error:
+            self._cache = None
+            with contextlib.suppress(sqlite3.Error):
+                cache.close()
+            return None
+
+    def _send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """Send ``request``, backing off and retrying on 429 (and 503 for reads)."""
+        retry_on = (
+            _RETRY_STATUSES
+            if request.method in _IDEMPOTENT_METHODS
+            else _WRITE_RETRY_STATUSES
+        )
+        attempt = 0
+        while True:
+            wait = self._paused_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            resp = self._client.send(request, stream=stream)
+            pause = _rate_limit_pause(resp)
+            if pause:
+                self._paused_until = time.monotonic() + pause
+            attempt += 1
+            if resp.status_code not in retry_on or attempt >= MAX_ATTEMPTS:
+                return resp
+            resp.close()
+            time.sleep(_retry_delay(resp, attempt))
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        resp = self._client.get(path, params=params)
+        return self._cached_get(path, params, stream=False)
+
+    def _get_large(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Like ``_get``, but reads the body in chunks as it arrives.
+
+        Used for endpoints whose responses can run to several megabytes.
+        """
+        return self._cached_get(path, params, stream=True)
+
+    def _get_page(self, path: str, params: dict[str, Any]) -> Any:
+        if params["pageSize"] >= LARGE_PAGE_SIZE:
+            return self._get_large(path, params)
+        return self._get(path, params)
+
+    def _cached_get(
+        self, path: str, params: dict[str, Any] | None, stream: bool
+    ) -> Any:
+        body = self._get_bytes(path, params, stream)
+        return body if self._raw else _json.loads(body)
+
+    def _get_bytes(
+        self, path: str, params: dict[str, Any] | None, stream: bool = False
+    ) -> bytes:
+        """GET ``path`` through the cache and return the raw JSON body."""
+        request = self._client.build_request("GET", path, params=params)
+        url = str(request.url)
+        cached = self._with_cache(lambda c: c.get(url))
+        if cached is not None:
+            if cached.fresh:
+                return cached.body
+            request.headers.update(cached.validators())
+
+        resp = self._send(request, stream=stream)
+        if stream:
+            try:
+                if resp.is_success:
+                    body = b"".join(resp.iter_bytes(STREAM_CHUNK_SIZE))
+                else:
+                    # Keep the body readable for error reporting.
+                    body = resp.read()
+            finally:
+                resp.close()
+        else:
+            body = resp.content
+
+        if resp.status_code == 304 and cached is not None:
+            self._with_cache(lambda c: c.refresh(url, resp.headers))
+            return cached.body
         resp.raise_for_status()
-        return resp.json()
+        self._with_cache(lambda c: c.store(url, path, resp.headers, body))
+        return body
 
-    def _post(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        resp = self._client.post(path, json=json)
-        resp.raise_for_status()
-        return resp.json()
+    def _post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        invalidates: tuple[str, ...] = (),
+    ) -> Any:
+        return self._write("POST", path, json, invalidates)
+
+    def _put(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        invalidates: tuple[str, ...] = (),
+    ) -> Any:
+        return self._write("PUT", path, json, invalidates)
 
-    def _put(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        resp = self._client.put(path, json=json)
+    def _write(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None,
+        invalidates: tuple[str, ...] = (),
+    ) -> Any:
+        """Send a write, first dropping cached reads of ``path`` and ``invalidates``."""
+        for stale in (path, *invalidates):
+            self._with_cache(lambda c: c.invalidate(stale))
+        if json is not None:
+            request = self._client.build_request(
+                method, path, content=_json.dumps(json), headers=_JSON_HEADERS
+            )
+        else:
+            request = self._client.build_request(method, path)
+        resp = self._send(request)
         resp.raise_for_status()
-        return resp.json()
+        return resp.content if self._raw else _decode(resp)
 
     def _delete(self, path: str) -> int:
-        resp = self._client.delete(path)
+        resp = self._send(self._client.build_request("DELETE", path))
         resp.raise_for_status()
         return resp.status_code
 
     # -- workouts ------------------------------------------------------------
 
     def get_workouts(self, page: int = 1, page_size: int = 5) -> dict:
-        return self._get("/v1/workouts", params={"page": page, "pageSize": page_size})
+        return self._get_page(
+            _P_WORKOUTS, params={"page": page, "pageSize": page_size}
+        )
+
+    def get_workouts_typed(self, page: int = 1, page_size: int = 5) -> WorkoutsPage:
+        """Like ``get_workouts``, but decoded straight into msgspec structs."""
+        from hevy_cli.models import WorkoutsPage
+
+        params = {"page": page, "pageSize": page_size}
+        stream = page_size >= LARGE_PAGE_SIZE
+        body = self._get_bytes(_P_WORKOUTS, params, stream=stream)
+        return msgspec.json.decode(body, type=WorkoutsPage)
 
     def get_workout(self, workout_id: str) -> dict:
-        return self._get(f"/v1/workouts/{workout_id}")
+        return self._get(_P_WORKOUTS + "/" + workout_id)
 
     def get_workout_count(self) -> dict:
-        return self._get("/v1/workouts/count")
+        return self._get(_P_WORKOUT_COUNT)
 
     def get_workout_events(
         self, page: int = 1, page_size: int = 5, since: str = "1970-01-01T00:00:00Z"
     ) -> dict:
-        return self._get(
-            "/v1/workouts/events",
+        return self._get_page(
+            _P_WORKOUT_EVENTS,
             params={"page": page, "pageSize": page_size, "since": since},
         )
 
     def create_workout(self, workout: dict) -> dict:
-        return self._post("/v1/workouts", json={"workout": workout})
+        return self._post(
+            _P_WORKOUTS, json={"workout": workout}, invalidates=_WORKOUT_DEPENDENTS
+        )
 
     def update_workout(self, workout_id: str, workout: dict) -> dict:
-        return self._put(f"/v1/workouts/{workout_id}", json={"workout": workout})
+        return self._put(
+            _P_WORKOUTS + "/" + workout_id,
+            json={"workout": workout},
+            invalidates=_WORKOUT_DEPENDENTS,
+        )
 
     # -- routines ------------------------------------------------------------
 
     def get_routines(self, page: int = 1, page_size: int = 5) -> dict:
-        return self._get("/v1/routines", params={"page": page, "pageSize": page_size})
+        return self._get_page(
+            _P_ROUTINES, params={"page": page, "pageSize": page_size}
+        )
 
     def get_routine(self, routine_id: str) -> dict:
-        return self._get(f"/v1/routines/{routine_id}")
+        return self._get(_P_ROUTINES + "/" + routine_id)
 
     def create_routine(self, routine: dict) -> dict:
-        return self._post("/v1/routines", json={"routine": routine})
+        return self._post(_P_ROUTINES, json={"routine": routine})
 
     def update_routine(self, routine_id: str, routine: dict) -> dict:
-        return self._put(f"/v1/routines/{routine_id}", json={"routine": routine})
+        return self._put(_P_ROUTINES + "/" + routine_id, json={"routine": routine})
 
     # -- exercise templates --------------------------------------------------
 
     def get_exercise_templates(self, page: int = 1, page_size: int = 5) -> dict:
-        return self._get(
-            "/v1/exercise_templates", params={"page": page, "pageSize": page_size}
+        return self._get_page(
+            _P_TEMPLATES, params={"page": page, "pageSize": page_size}
         )
 
     def get_exercise_template(self, template_id: str) -> dict:
-        return self._get(f"/v1/exercise_templates/{template_id}")
+        path = _P_TEMPLATES + "/" + template_id
+        if self._raw:
+            return self._get(path)
+        if template_id in self._tpl_cache:
+            return self._tpl_cache[template_id]
+        v = self._get(path)
+        self._tpl_cache[template_id] = v
+        return v
 
     def get_exercise_history(
         self,
@@ -101,22 +372,162 @@ class HevyClient:
             params["startDate"] = start_date
         if end_date:
             params["endDate"] = end_date
-        return self._get(f"/v1/exercise_history/{template_id}", params=params or None)
+        return self._get_large(_P_HISTORY + "/" + template_id, params=params or None)
 
     def create_exercise_template(self, template: dict) -> dict:
-        return self._post(
-            "/v1/exercise_templates", json={"exercise_template": template}
-        )
+        self._tpl_cache.clear()
+        return self._post(_P_TEMPLATES, json={"exercise_template": template})
 
     # -- routine folders -----------------------------------------------------
 
     def get_routine_folders(self, page: int = 1, page_size: int = 5) -> dict:
-        return self._get(
-            "/v1/routine_folders", params={"page": page, "pageSize": page_size}
+        return self._get_page(
+            _P_FOLDERS, params={"page": page, "pageSize": page_size}
         )
 
     def get_routine_folder(self, folder_id: str) -> dict:
-        return self._get(f"/v1/routine_folders/{folder_id}")
+        path = _P_FOLDERS + "/" + folder_id
+        if self._raw:
+            return self._get(path)
+        if folder_id in self._folder_cache:
+            return self._folder_cache[folder_id]
+        v = self._get(path)
+        self._folder_cache[folder_id] = v
+        return v
 
     def create_routine_folder(self, name: str) -> dict:
-        return self._post("/v1/routine_folders", json={"routine_folder": {"title": name}})
+        self._folder_cache.clear()
+        return self._post(_P_FOLDERS, json={"routine_folder": {"title": name}})
+
+
+class AsyncHevyClient:
+    """Async HTTP client for the Hevy API, for fanning out many reads at once."""
+
+    def __init__(self, api_key: str, max_concurrency: int = MAX_CONCURRENCY) -> None:
+        self._paused_until = 0.0
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=64),
+            retries=CONNECT_RETRIES,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={"api-key": api_key},
+            timeout=30.0,
+            transport=transport,
+        )
+        self._sem = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> AsyncHevyClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # -- low-level helpers ---------------------------------------------------
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send ``request``, backing off and retrying on 429/503."""
+        attempt = 0
+        while True:
+            wait = self._paused_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self._sem:
+                resp = await self._client.send(request)
+            pause = _rate_limit_pause(resp)
+            if pause:
+                self._paused_until = time.monotonic() + pause
+            attempt += 1
+            if resp.status_code not in _RETRY_STATUSES or attempt >= MAX_ATTEMPTS:
+                return resp
+            await asyncio.sleep(_retry_delay(resp, attempt))
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        resp = await self._send(self._client.build_request("GET", path, params=params))
+        resp.raise_for_status()
+        return _decode(resp)
+
+    async def fetch_all_pages(
+        self,
+        method: Callable[[int, int], Awaitable[dict]],
+        page_size: int = 10,
+    ) -> list[dict]:
+        """Fetch page 1, then every remaining page concurrently.
+
+        ``method`` is one of the paged ``get_*`` coroutines on this client.
+        Pages are returned in order.
+        """
+        first = await method(1, page_size)
+        page_count = first.get("page_count") or 1
+        rest = await asyncio.gather(
+            *[method(p, page_size) for p in range(2, page_count + 1)]
+        )
+        return [first, *rest]
+
+    # -- workouts ------------------------------------------------------------
+
+    async def get_workouts(self, page: int = 1, page_size: int = 5) -> dict:
+        return await self._get(
+            _P_WORKOUTS, params={"page": page, "pageSize": page_size}
+        )
+
+    async def get_workout(self, workout_id: str) -> dict:
+        return await self._get(_P_WORKOUTS + "/" + workout_id)
+
+    async def get_workout_count(self) -> dict:
+        return await self._get(_P_WORKOUT_COUNT)
+
+    async def get_workout_events(
+        self, page: int = 1, page_size: int = 5, since: str = "1970-01-01T00:00:00Z"
+    ) -> dict:
+        return await self._get(
+            _P_WORKOUT_EVENTS,
+            params={"page": page, "pageSize": page_size, "since": since},
+        )
+
+    # -- routines ------------------------------------------------------------
+
+    async def get_routines(self, page: int = 1, page_size: int = 5) -> dict:
+        return await self._get(
+            _P_ROUTINES, params={"page": page, "pageSize": page_size}
+        )
+
+    async def get_routine(self, routine_id: str) -> dict:
+        return await self._get(_P_ROUTINES + "/" + routine_id)
+
+    # -- exercise templates --------------------------------------------------
+
+    async def get_exercise_templates(self, page: int = 1, page_size: int = 5) -> dict:
+        return await self._get(
+            _P_TEMPLATES, params={"page": page, "pageSize": page_size}
+        )
+
+    async def get_exercise_template(self, template_id: str) -> dict:
+        return await self._get(_P_TEMPLATES + "/" + template_id)
+
+    async def get_exercise_history(
+        self,
+        template_id: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> dict:
+        params: dict[str, Any] = {}
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+        return await self._get(_P_HISTORY + "/" + template_id, params=params or None)
+
+    # -- routine folders -----------------------------------------------------
+
+    async def get_routine_folders(self, page: int = 1, page_size: int = 5) -> dict:
+        return await self._get(
+            _P_FOLDERS, params={"page": page, "pageSize": page_size}
+        )
+
+    async def get_routine_folder(self, folder_id: str) -> dict:
+        return await self._get(_P_FOLDERS + "/" + folder_id)
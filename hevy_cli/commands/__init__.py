@@ -0,0 +1,6 @@
+"""Subcommand groups for ``hevy``.
+
+Each module exposes a click ``group`` that only holds its subcommands:
+``hevy_cli.main`` registers the group's name and help in ``_GROUPS`` and
+imports the module the first time the group is used.
+"""
@@ -0,0 +1,229 @@
+"""Helpers shared by the ``hevy`` subcommand modules."""
+
+from __future__ import annotations
+
+import functools
+import mmap
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NoReturn
+
+import click
+
+from hevy_cli import _json
+
+# httpx, rich (via hevy_cli.display) and the client are imported inside the
+# functions that use them, so ``--help`` and argument errors never load them.
+if TYPE_CHECKING:
+    import httpx
+
+    from hevy_cli.client import HevyClient
+
+
+# One-line status messages go straight to stderr; rich is kept for tables.
+# Colour follows the same rules rich applied: a TTY, no NO_COLOR, no TERM=dumb.
+COLOR = (
+    sys.stderr.isatty()
+    and not os.environ.get("NO_COLOR")
+    and os.environ.get("TERM") != "dumb"
+)
+RED = b"\x1b[31m"
+GREEN = b"\x1b[32m"
+YELLOW = b"\x1b[33m"
+DIM = b"\x1b[2m"
+RESET = b"\x1b[0m"
+
+# Option types shared by every paged command, built once instead of per option.
+PAGE_TYPE = click.IntRange(1, None)
+PAGE_SIZE_SMALL = click.IntRange(1, 10)
+PAGE_SIZE_LARGE = click.IntRange(1, 100)
+
+
+def pagination_opts(
+    page_size_type: click.IntRange = PAGE_SIZE_SMALL,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Add the standard ``--page`` / ``--page-size`` options to a list command."""
+    size_help = f"Items per page ({page_size_type.min}-{page_size_type.max}, default 5)."
+
+    def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        f = click.option("--page-size", default=5, type=page_size_type, help=size_help)(f)
+        return click.option(
+            "--page", default=1, type=PAGE_TYPE, help="Page number (default 1)."
+        )(f)
+
+    return decorator
+
+
+class FastChoice(click.Choice):
+    """``click.Choice`` that accepts exact matches with one frozenset lookup.
+
+    Anything else (wrong case, typos) falls through to click's own scan, so
+    normalisation and error messages are unchanged.
+    """
+
+    def __init__(self, choices: tuple[str, ...], case_sensitive: bool = True) -> None:
+        super().__init__(choices, case_sensitive)
+        self._members = frozenset(choices)
+
+    def convert(
+        self, value: Any, param: click.Parameter | None, ctx: click.Context | None
+    ) -> Any:
+        if value in self._members:
+            return value
+        return super().convert(value, param, ctx)
+
+
+def status(msg: str, color: bytes) -> None:
+    line = msg.encode()
+    if COLOR:
+        line = color + line + RESET
+    sys.stderr.flush()
+    sys.stderr.buffer.write(line + b"\n")
+    sys.stderr.buffer.flush()
+
+
+def err(msg: str) -> None:
+    status(msg, RED)
+
+
+@dataclass(slots=True)
+class AppCtx:
+    """Global options plus the API client; ``pass_app`` hands it to subcommands."""
+
+    api_key: str
+    json_output: bool = False
+    plain: bool = False
+    cache: bool = True
+    _client: HevyClient | None = field(default=None, repr=False)
+
+    @property
+    def client(self) -> HevyClient:
+        """The API client, created on first use so ``--help`` never builds one."""
+        if self._client is None:
+            from hevy_cli.client import HevyClient
+
+            self._client = HevyClient(self.api_key, cache=self.cache)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+
+class APIError(click.ClickException):
+    """An error response from the Hevy API; click prints it and exits with 1."""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        super().__init__(f"{status_code}: {body}")
+        self.status_code = status_code
+
+    def format_message(self) -> str:
+        return f"API error {self.message}"
+
+
+# Injects the AppCtx built by ``cli`` into a command as its first argument.
+pass_app = click.make_pass_decorator(AppCtx)
+
+
+def handle_api_error(e: httpx.HTTPStatusError) -> NoReturn:
+    try:
+        body = e.response.json()
+    except Exception:
+        body = e.response.text
+    raise APIError(e.response.status_code, body) from e
+
+
+def run(
+    app: AppCtx,
+    call: Callable[[], Any],
+    renderer: Callable[..., None],
+    *render_args: Any,
+    success: str | None = None,
+    **render_kwargs: Any,
+) -> None:
+    """Run an API call, report HTTP errors, then print JSON or render the result.
+
+    In JSON mode the response body is printed without being decoded.
+    """
+    import httpx
+
+    from hevy_cli import display
+
+    try:
+        if app.json_output:
+            with app.client.raw_bodies():
+                data = call()
+        else:
+            data = call()
+    except httpx.HTTPStatusError as e:
+        handle_api_error(e)
+    if app.json_output:
+        display.print_json_bytes(data)
+        return
+    if success:
+        status(success, GREEN)
+    renderer(data, *render_args, **render_kwargs)
+
+
+def iter_pages(
+    fetch: Callable[[int, int], dict], page_size: int, key: str, start: int = 1
+) -> Iterator[dict]:
+    """Yield each non-empty page payload from ``start`` on, fetching lazily."""
+    import httpx
+
+    page = start
+    while True:
+        try:
+            data = fetch(page, page_size)
+        except httpx.HTTPStatusError as e:
+            # Hevy answers 404 for pages past the last one.
+            if page > start and e.response.status_code == 404:
+                return
+            handle_api_error(e)
+        if not data.get(key):
+            return
+        yield data
+        if page >= data.get("page_count", page):
+            return
+        page += 1
+
+
+def stream(
+    app: AppCtx, pages: Iterator[dict], key: str, renderer: Callable[..., None]
+) -> None:
+    """Print paged results as NDJSON items, or a table per page as it arrives."""
+    if app.json_output:
+        from hevy_cli import display
+
+        display.print_ndjson(item for data in pages for item in data[key])
+    else:
+        renderer(pages, plain=app.plain)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; keyed on (mtime, size) so edits invalidate the entry.
+
+    The parsed object is shared between hits, so callers must not mutate it.
+    """
+    with open(path, "rb") as f:
+        if _json.HAS_ORJSON:
+            # orjson parses straight from the mapped pages, skipping a read copy.
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # empty file, or not mappable
+                pass
+            else:
+                with mm, memoryview(mm) as view:
+                    return _json.loads(view)
+        return _json.loads(f.read())
+
+
+def load_json_arg(value: str) -> list | dict:
+    """Parse a JSON string or read from a file prefixed with @."""
+    if value.startswith("@"):
+        path = value[1:]
+        st = os.stat(path)
+        return _load_json_file(path, st.st_mtime_ns, st.st_size)
+    return _json.loads(value)
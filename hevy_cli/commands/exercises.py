@@ -0,0 +1,123 @@
+"""``hevy exercises`` subcommands."""
+
+from __future__ import annotations
+
+import click
+
+from hevy_cli.commands._common import (
+    PAGE_SIZE_LARGE,
+    AppCtx,
+    FastChoice,
+    pagination_opts,
+    pass_app,
+    run,
+)
+
+
+# Shared enum values (match the Hevy API spec)
+EXERCISE_TYPES = (
+    "weight_reps", "reps_only", "bodyweight_reps", "bodyweight_assisted_reps",
+    "duration", "weight_duration", "distance_duration", "short_distance_weight",
+)
+EQUIPMENT_CATEGORIES = (
+    "none", "barbell", "dumbbell", "kettlebell", "machine",
+    "plate", "resistance_band", "suspension", "other",
+)
+MUSCLE_GROUPS = (
+    "abdominals", "shoulders", "biceps", "triceps", "forearms",
+    "quadriceps", "hamstrings", "calves", "glutes", "abductors",
+    "adductors", "lats", "upper_back", "traps", "lower_back",
+    "chest", "cardio", "neck", "full_body", "other",
+)
+SET_TYPES = ("warmup", "normal", "failure", "dropset")
+
+# Built once and shared by every option that validates against them.
+EXERCISE_TYPE_CHOICE = FastChoice(EXERCISE_TYPES)
+EQUIPMENT_CHOICE = FastChoice(EQUIPMENT_CATEGORIES)
+MUSCLE_CHOICE = FastChoice(MUSCLE_GROUPS)
+
+
+group = click.Group("exercises")
+
+
+@group.command("list")
+@pagination_opts(PAGE_SIZE_LARGE)
+@pass_app
+def exercises_list(app: AppCtx, page: int, page_size: int) -> None:
+    """List exercise templates."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_exercise_templates(page, page_size),
+        display.print_exercise_templates,
+        plain=app.plain,
+    )
+
+
+@group.command("get")
+@click.argument("template_id")
+@pass_app
+def exercises_get(app: AppCtx, template_id: str) -> None:
+    """Get an exercise template by ID."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_exercise_template(template_id),
+        display.print_exercise_template_detail,
+    )
+
+
+@group.command("history")
+@click.argument("template_id")
+@click.option("--start-date", default=None, help="ISO-8601 start date filter.")
+@click.option("--end-date", default=None, help="ISO-8601 end date filter.")
+@pass_app
+def exercises_history(
+    app: AppCtx, template_id: str, start_date: str | None, end_date: str | None
+) -> None:
+    """Get exercise history for a template."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_exercise_history(template_id, start_date, end_date),
+        display.print_exercise_history,
+        template_id,
+        plain=app.plain,
+    )
+
+
+@group.command("create")
+@click.option("--title", required=True)
+@click.option("--exercise-type", required=True, type=EXERCISE_TYPE_CHOICE)
+@click.option("--equipment", required=True, type=EQUIPMENT_CHOICE)
+@click.option("--muscle-group", required=True, type=MUSCLE_CHOICE)
+@click.option("--other-muscles", multiple=True, type=MUSCLE_CHOICE, help="Secondary muscles (repeatable).")
+@pass_app
+def exercises_create(
+    app: AppCtx,
+    title: str,
+    exercise_type: str,
+    equipment: str,
+    muscle_group: str,
+    other_muscles: tuple[str, ...],
+) -> None:
+    """Create a custom exercise template."""
+    from hevy_cli import display
+
+    template = {
+        "title": title,
+        "type": exercise_type,
+        "equipment_category": equipment,
+        "primary_muscle_group": muscle_group,
+    }
+    if other_muscles:
+        template["secondary_muscle_groups"] = list(other_muscles)
+    run(
+        app,
+        lambda: app.client.create_exercise_template(template),
+        display.print_exercise_template_detail,
+        success="Exercise template created.",
+    )
@@ -0,0 +1,59 @@
+"""``hevy folders`` subcommands."""
+
+from __future__ import annotations
+
+import click
+
+from hevy_cli.commands._common import (
+    AppCtx,
+    pagination_opts,
+    pass_app,
+    run,
+)
+
+
+group = click.Group("folders")
+
+
+@group.command("list")
+@pagination_opts()
+@pass_app
+def folders_list(app: AppCtx, page: int, page_size: int) -> None:
+    """List routine folders."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_routine_folders(page, page_size),
+        display.print_routine_folders,
+        plain=app.plain,
+    )
+
+
+@group.command("get")
+@click.argument("folder_id")
+@pass_app
+def folders_get(app: AppCtx, folder_id: str) -> None:
+    """Get a routine folder by ID."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_routine_folder(folder_id),
+        display.print_routine_folder_detail,
+    )
+
+
+@group.command("create")
+@click.option("--name", required=True, help="Folder name.")
+@pass_app
+def folders_create(app: AppCtx, name: str) -> None:
+    """Create a routine folder."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.create_routine_folder(name),
+        display.print_routine_folder_detail,
+        success="Folder created.",
+    )
@@ -0,0 +1,138 @@
+"""``hevy routines`` subcommands."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+import click
+
+from hevy_cli import _json
+from hevy_cli.commands._common import (
+    DIM,
+    YELLOW,
+    AppCtx,
+    err,
+    load_json_arg,
+    pagination_opts,
+    pass_app,
+    run,
+    status,
+)
+
+
+group = click.Group("routines")
+
+
+@group.command("list")
+@pagination_opts()
+@pass_app
+def routines_list(app: AppCtx, page: int, page_size: int) -> None:
+    """List routines."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_routines(page, page_size),
+        display.print_routines,
+        plain=app.plain,
+    )
+
+
+@group.command("get")
+@click.argument("routine_id")
+@pass_app
+def routines_get(app: AppCtx, routine_id: str) -> None:
+    """Get a single routine by ID."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_routine(routine_id),
+        display.print_routine_detail,
+    )
+
+
+@group.command("create")
+@click.option("--title", required=True)
+@click.option("--folder-id", required=True, type=int, help="Routine folder ID (required). List folders with: hevy folders list")
+@click.option("--notes", default=None)
+@click.option("--exercises-json", default=None, help="JSON string or @file path for exercises array.")
+@pass_app
+def routines_create(
+    app: AppCtx,
+    title: str,
+    folder_id: int,
+    notes: str | None,
+    exercises_json: str | None,
+) -> None:
+    """Create a new routine. Note: folder-id is required by the Hevy API."""
+    from hevy_cli import display
+
+    if folder_id <= 0:
+        err("Error: folder-id must be a positive integer")
+        sys.exit(1)
+
+    routine = {
+        k: v
+        for k, v in (
+            ("title", title),
+            ("folder_id", folder_id),
+            ("notes", notes or None),
+            ("exercises", load_json_arg(exercises_json) if exercises_json else None),
+        )
+        if v is not None
+    }
+
+    # Debug: Show what we're sending
+    if os.environ.get("DEBUG"):
+        status(f"DEBUG: Sending routine data: {routine}", DIM)
+
+    def create() -> Any:
+        data = app.client.create_routine(routine)
+        # Debug: Show what we received
+        if os.environ.get("DEBUG"):
+            # Under --json-output the client hands back the undecoded body.
+            shown = _json.loads(data) if isinstance(data, bytes) else data
+            status(f"DEBUG: Received data type: {type(shown)}, value: {shown}", DIM)
+        return data
+
+    run(app, create, display.print_routine_detail, success="Routine created.")
+
+
+@group.command("update")
+@click.argument("routine_id")
+@click.option("--title", default=None)
+@click.option("--notes", default=None)
+@click.option("--exercises-json", default=None, help="JSON string or @file path for exercises array.")
+@pass_app
+def routines_update(
+    app: AppCtx,
+    routine_id: str,
+    title: str | None,
+    notes: str | None,
+    exercises_json: str | None,
+) -> None:
+    """Update an existing routine."""
+    from hevy_cli import display
+
+    routine = {
+        k: v
+        for k, v in (
+            ("title", title),
+            ("notes", notes),
+            ("exercises", load_json_arg(exercises_json) if exercises_json else None),
+        )
+        if v is not None
+    }
+    if not routine:
+        status("Nothing to update -- provide at least one option.", YELLOW)
+        sys.exit(1)
+
+    run(
+        app,
+        lambda: app.client.update_routine(routine_id, routine),
+        display.print_routine_detail,
+        success="Routine updated.",
+    )
@@ -0,0 +1,191 @@
+"""``hevy workouts`` subcommands."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from hevy_cli.commands._common import (
+    YELLOW,
+    AppCtx,
+    iter_pages,
+    load_json_arg,
+    pagination_opts,
+    pass_app,
+    run,
+    status,
+    stream,
+)
+
+
+group = click.Group("workouts")
+
+
+@group.command("list")
+@pagination_opts()
+@click.option("--all", "all_pages", is_flag=True, help="Fetch every page from --page on, printing each page as it arrives.")
+@pass_app
+def workouts_list(app: AppCtx, page: int, page_size: int, all_pages: bool) -> None:
+    """List workouts (newest first)."""
+    from hevy_cli import display
+
+    if all_pages:
+        pages = iter_pages(app.client.get_workouts, page_size, "workouts", page)
+        stream(app, pages, "workouts", display.stream_workouts)
+        return
+
+    from hevy_cli.client import HAS_MSGSPEC
+
+    if HAS_MSGSPEC and not app.json_output:
+        run(
+            app,
+            lambda: app.client.get_workouts_typed(page, page_size),
+            display.print_workouts_page,
+            plain=app.plain,
+        )
+        return
+    run(
+        app,
+        lambda: app.client.get_workouts(page, page_size),
+        display.print_workouts,
+        plain=app.plain,
+    )
+
+
+@group.command("get")
+@click.argument("workout_id")
+@pass_app
+def workouts_get(app: AppCtx, workout_id: str) -> None:
+    """Get a single workout by ID."""
+    from hevy_cli import display
+
+    run(
+        app,
+        lambda: app.client.get_workout(workout_id),
+        display.print_workout_detail,
+    )
+
+
+@group.command("count")
+@pass_app
+def workouts_count(app: AppCtx) -> None:
+    """Get total workout count."""
+    from hevy_cli import display
+
+    run(app, lambda: app.client.get_workout_count(), display.print_workout_count)
+
+
+@group.command("events")
+@pagination_opts()
+@click.option("--since", default="1970-01-01T00:00:00Z", help="ISO-8601 datetime to filter from.")
+@click.option("--all", "all_pages", is_flag=True, help="Fetch every page from --page on, printing each page as it arrives.")
+@pass_app
+def workouts_events(
+    app: AppCtx, page: int, page_size: int, since: str, all_pages: bool
+) -> None:
+    """Get workout update/delete events."""
+    from hevy_cli import display
+
+    if all_pages:
+        client = app.client
+        pages = iter_pages(
+            lambda p, size: client.get_workout_events(p, size, since),
+            page_size,
+            "events",
+            page,
+        )
+        stream(app, pages, "events", display.stream_workout_events)
+        return
+    run(
+        app,
+        lambda: app.client.get_workout_events(page, page_size, since),
+        display.print_workout_events,
+        plain=app.plain,
+    )
+
+
+@group.command("create")
+@click.option("--title", required=True)
+@click.option("--description", default=None)
+@click.option("--start-time", required=True, help="ISO-8601 start time.")
+@click.option("--end-time", required=True, help="ISO-8601 end time.")
+@click.option("--is-private", is_flag=True, default=False)
+@click.option("--exercises-json", default=None, help="JSON string or @file path for exercises array.")
+@pass_app
+def workouts_create(
+    app: AppCtx,
+    title: str,
+    description: str | None,
+    start_time: str,
+    end_time: str,
+    is_private: bool,
+    exercises_json: str | None,
+) -> None:
+    """Create a new workout."""
+    from hevy_cli import display
+
+    workout = {
+        k: v
+        for k, v in (
+            ("title", title),
+            ("description", description or None),
+            ("start_time", start_time),
+            ("end_time", end_time),
+            ("is_private", is_private),
+            ("exercises", load_json_arg(exercises_json) if exercises_json else None),
+        )
+        if v is not None
+    }
+    run(
+        app,
+        lambda: app.client.create_workout(workout),
+        display.print_workout_detail,
+        success="Workout created.",
+    )
+
+
+@group.command("update")
+@click.argument("workout_id")
+@click.option("--title", default=None)
+@click.option("--description", default=None)
+@click.option("--start-time", default=None, help="ISO-8601 start time.")
+@click.option("--end-time", default=None, help="ISO-8601 end time.")
+@click.option("--is-private", type=bool, default=None)
+@click.option("--exercises-json", default=None, help="JSON string or @file path for exercises array.")
+@pass_app
+def workouts_update(
+    app: AppCtx,
+    workout_id: str,
+    title: str | None,
+    description: str | None,
+    start_time: str | None,
+    end_time: str | None,
+    is_private: bool | None,
+    exercises_json: str | None,
+) -> None:
+    """Update an existing workout."""
+    from hevy_cli import display
+
+    workout = {
+        k: v
+        for k, v in (
+            ("title", title),
+            ("description", description),
+            ("start_time", start_time),
+            ("end_time", end_time),
+            ("is_private", is_private),
+            ("exercises", load_json_arg(exercises_json) if exercises_json else None),
+        )
+        if v is not None
+    }
+    if not workout:
+        status("Nothing to update -- provide at least one option.", YELLOW)
+        sys.exit(1)
+
+    run(
+        app,
+        lambda: app.client.update_workout(workout_id, workout),
+        display.print_workout_detail,
+        success="Workout updated.",
+    )
@@ -2,72 +2,253 @@
 
 from __future__ import annotations
 
+import functools
+import io
+import sys
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
+
+from hevy_cli import _json
+
+if TYPE_CHECKING:
+    from hevy_cli.models import WorkoutsPage
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+
+    def _parse_iso(ts: str) -> datetime:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
 
 console = Console()
 
 
-def _parse_ts(ts: str | int | float | None) -> str:
-    if ts is None:
-        return "-"
+@functools.lru_cache(maxsize=4096)
+def _parse_ts_cached(ts: str | int | float) -> str:
     if isinstance(ts, (int, float)):
         dt = datetime.fromtimestamp(ts, tz=timezone.utc)
     else:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    return dt.strftime("%Y-%m-%d %H:%M")
+        dt = _parse_iso(ts)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _parse_ts(ts: str | int | float | None) -> str:
+    if ts is None:
+        return "-"
+    return _parse_ts_cached(ts)
+
+
+_NUMERIC = (int, float)
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_epoch(v: str | int | float) -> float:
+    if isinstance(v, (int, float)):
+        return float(v)
+    return _parse_iso(v).timestamp()
 
 
 def _duration(start: str | int | float | None, end: str | int | float | None) -> str:
     if start is None or end is None:
         return "-"
 
-    def _to_epoch(v: str | int | float) -> float:
-        if isinstance(v, (int, float)):
-            return float(v)
-        dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
-        return dt.timestamp()
-
-    secs = _to_epoch(end) - _to_epoch(start)
+    if type(start) in _NUMERIC and type(end) in _NUMERIC:
+        secs = end - start
+    else:
+        secs = _to_epoch(end) - _to_epoch(start)
     if secs < 0:
         return "-"
     mins = int(secs // 60)
     return f"{mins}m"
 
 
-# -- Workouts ----------------------------------------------------------------
+def _fmt(v: Any) -> str:
+    return "-" if v is None else str(v)
 
 
-def print_workouts(data: dict) -> None:
-    workouts = data.get("workouts", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
+# (key, format) pairs rendered for each set, in display order.
+_SET_FIELDS = (
+    ("weight_kg", "{}kg"),
+    ("reps", "x{}"),
+    ("distance_meters", "{}m"),
+    ("duration_seconds", "{}s"),
+    ("rpe", "RPE {}"),
+)
+# Routine sets are planned, so they carry no RPE.
+_ROUTINE_SET_FIELDS = _SET_FIELDS[:-1]
 
-    if not workouts:
-        console.print("[dim]No workouts found.[/dim]")
+
+def _format_set(s: dict, fields: tuple[tuple[str, str], ...] = _SET_FIELDS) -> str:
+    parts = []
+    st = s.get("type", "normal")
+    if st != "normal":
+        parts.append(f"[{st}]")
+    for key, fmt in fields:
+        v = s.get(key)
+        if v is not None:
+            parts.append(fmt.format(v))
+    return " ".join(parts) if parts else "-"
+
+
+def _print_exercise(ex: dict, fields: tuple[tuple[str, str], ...]) -> None:
+    buf = io.StringIO()
+    w = buf.write
+    notes = ex.get("notes")
+    if notes:
+        w("  Note: ")
+        w(notes)
+        w("\n")
+    for i, s in enumerate(ex.get("sets", []), 1):
+        w("  Set ")
+        w(str(i))
+        w(": ")
+        w(_format_set(s, fields))
+        w("\n")
+    console.print(f"\n[bold cyan]{ex.get('title', 'Unknown')}[/bold cyan]")
+    console.print(buf.getvalue(), end="")
+
+
+def _write_plain(
+    table: Table, rows: Iterable[tuple[str, ...]], header: bool = True
+) -> None:
+    out = sys.stdout.write
+    if header:
+        out("\t".join(str(c.header) for c in table.columns) + "\n")
+    for row in rows:
+        # API fields can be null even when the key is present.
+        out("\t".join("" if c is None else str(c) for c in row) + "\n")
+
+
+def _emit(table: Table, rows: list[tuple[str, ...]], plain: bool) -> None:
+    """Print ``rows`` into ``table``, or as bare tab-separated lines if ``plain``."""
+    if plain:
+        _write_plain(table, rows)
         return
+    add = table.add_row
+    for row in rows:
+        add(*row)
+    console.print(table)
+
+
+def _stream_pages(
+    pages: Iterable[dict],
+    key: str,
+    make_table: Callable[[str], Table],
+    title: str,
+    row: Callable[[dict], tuple[str, ...]],
+    plain: bool,
+    empty: str,
+) -> None:
+    """Print each page of a lazy multi-page iterable as soon as it arrives.
+
+    Only one page of rows is held at a time; plain output writes a single
+    header line, then every page's rows.
+    """
+    shown = False
+    for data in pages:
+        page = data.get("page", "?")
+        page_count = data.get("page_count", "?")
+        table = make_table(f"{title} (page {page}/{page_count})")
+        rows = map(row, data.get(key) or [])
+        if plain:
+            _write_plain(table, rows, header=not shown)
+            sys.stdout.flush()
+        else:
+            _emit(table, list(rows), plain)
+        shown = True
+    if not shown:
+        console.print(f"[dim]{empty}[/dim]")
+
+
+# -- Workouts ----------------------------------------------------------------
+
 
-    table = Table(title=f"Workouts (page {page}/{page_count})")
+def _workouts_table(title: str) -> Table:
+    table = Table(title=title)
     table.add_column("ID", style="dim", max_width=36)
     table.add_column("Title", style="bold")
     table.add_column("Date")
     table.add_column("Duration")
     table.add_column("Exercises", justify="right")
+    return table
+
+
+def _workout_cells(
+    workout_id: str | None,
+    title: str | None,
+    start: str | float | None,
+    end: str | float | None,
+    exercises: list | None,
+) -> tuple[str, ...]:
+    """One workout list row; shared by the dict and msgspec paths.
+
+    The API may send ``null`` for any of these, so each gets a default.
+    """
+    return (
+        workout_id or "",
+        title or "Untitled",
+        _parse_ts(start),
+        _duration(start, end),
+        str(len(exercises or ())),
+    )
+
+
+def _workout_row(w: dict) -> tuple[str, ...]:
+    return _workout_cells(
+        w.get("id"),
+        w.get("title"),
+        w.get("start_time"),
+        w.get("end_time"),
+        w.get("exercises"),
+    )
+
+
+def print_workouts(data: dict, plain: bool = False) -> None:
+    workouts = data.get("workouts", [])
+    if not workouts:
+        console.print("[dim]No workouts found.[/dim]")
+        return
 
-    for w in workouts:
-        table.add_row(
-            w.get("id", ""),
-            w.get("title", "Untitled"),
-            _parse_ts(w.get("start_time")),
-            _duration(w.get("start_time"), w.get("end_time")),
-            str(len(w.get("exercises", []))),
-        )
-    console.print(table)
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
+    table = _workouts_table(f"Workouts (page {page}/{page_count})")
+    _emit(table, list(map(_workout_row, workouts)), plain)
+
+
+def stream_workouts(pages: Iterable[dict], plain: bool = False) -> None:
+    """Render workout list pages from a lazy iterable as each one arrives."""
+    _stream_pages(
+        pages,
+        "workouts",
+        _workouts_table,
+        "Workouts",
+        _workout_row,
+        plain,
+        "No workouts found.",
+    )
+
+
+def print_workouts_page(data: WorkoutsPage, plain: bool = False) -> None:
+    """Typed variant of ``print_workouts`` for msgspec-decoded pages."""
+    workouts = data.workouts
+    if not workouts:
+        console.print("[dim]No workouts found.[/dim]")
+        return
+
+    page = "?" if data.page is None else data.page
+    page_count = "?" if data.page_count is None else data.page_count
+    table = _workouts_table(f"Workouts (page {page}/{page_count})")
+    rows = [
+        _workout_cells(w.id, w.title, w.start_time, w.end_time, w.exercises)
+        for w in workouts
+    ]
+    _emit(table, rows, plain)
 
 
 def print_workout_detail(data: dict) -> None:
@@ -88,32 +269,7 @@ def print_workout_detail(data: dict) -> None:
         return
 
     for ex in exercises:
-        ex_title = ex.get("title", "Unknown")
-        notes = ex.get("notes") or ""
-        sets = ex.get("sets", [])
-        sets_lines = []
-        for s in sets:
-            parts = []
-            st = s.get("type", "normal")
-            if st != "normal":
-                parts.append(f"[{st}]")
-            if s.get("weight_kg") is not None:
-                parts.append(f"{s['weight_kg']}kg")
-            if s.get("reps") is not None:
-                parts.append(f"x{s['reps']}")
-            if s.get("distance_meters") is not None:
-                parts.append(f"{s['distance_meters']}m")
-            if s.get("duration_seconds") is not None:
-                parts.append(f"{s['duration_seconds']}s")
-            if s.get("rpe") is not None:
-                parts.append(f"RPE {s['rpe']}")
-            sets_lines.append(" ".join(parts) if parts else "-")
-
-        body = "\n".join(f"  Set {i+1}: {line}" for i, line in enumerate(sets_lines))
-        if notes:
-            body = f"  Note: {notes}\n" + body
-        console.print(f"\n[bold cyan]{ex_title}[/bold cyan]")
-        console.print(body)
+        _print_exercise(ex, _SET_FIELDS)
 
 
 def print_workout_count(data: dict) -> None:
@@ -121,55 +277,74 @@ def print_workout_count(data: dict) -> None:
     console.print(f"Total workouts: [bold]{count}[/bold]")
 
 
-def print_workout_events(data: dict) -> None:
-    events = data.get("events", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
+def _events_table(title: str) -> Table:
+    table = Table(title=title)
+    table.add_column("Type", style="bold")
+    table.add_column("Workout ID", style="dim")
+    table.add_column("When")
+    return table
 
+
+def _event_row(e: dict) -> tuple[str, ...]:
+    return (
+        e.get("type", "?"),
+        e.get("workout_id", ""),
+        _parse_ts(e.get("timestamp") or e.get("created_at")),
+    )
+
+
+def print_workout_events(data: dict, plain: bool = False) -> None:
+    events = data.get("events", [])
     if not events:
         console.print("[dim]No workout events found.[/dim]")
         return
 
-    table = Table(title=f"Workout Events (page {page}/{page_count})")
-    table.add_column("Type", style="bold")
-    table.add_column("Workout ID", style="dim")
-    table.add_column("When")
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
+    table = _events_table(f"Workout Events (page {page}/{page_count})")
+    _emit(table, list(map(_event_row, events)), plain)
 
-    for e in events:
-        table.add_row(
-            e.get("type", "?"),
-            e.get("workout_id", ""),
-            _parse_ts(e.get("timestamp") or e.get("created_at")),
-        )
-    console.print(table)
+
+def stream_workout_events(pages: Iterable[dict], plain: bool = False) -> None:
+    """Render workout event pages from a lazy iterable as each one arrives."""
+    _stream_pages(
+        pages,
+        "events",
+        _events_table,
+        "Workout Events",
+        _event_row,
+        plain,
+        "No workout events found.",
+    )
 
 
 # -- Routines ----------------------------------------------------------------
 
 
-def print_routines(data: dict) -> None:
+def print_routines(data: dict, plain: bool = False) -> None:
     routines = data.get("routines", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
-
     if not routines:
         console.print("[dim]No routines found.[/dim]")
         return
 
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
     table = Table(title=f"Routines (page {page}/{page_count})")
     table.add_column("ID", style="dim", max_width=36)
     table.add_column("Title", style="bold")
     table.add_column("Folder ID")
     table.add_column("Exercises", justify="right")
 
-    for r in routines:
-        table.add_row(
+    rows = [
+        (
             r.get("id", ""),
             r.get("title", "Untitled"),
             str(r.get("folder_id") or "-"),
             str(len(r.get("exercises", []))),
         )
-    console.print(table)
+        for r in routines
+    ]
+    _emit(table, rows, plain)
 
 
 def print_routine_detail(data: dict) -> None:
@@ -197,43 +372,20 @@ def print_routine_detail(data: dict) -> None:
 
     exercises = r.get("exercises", [])
     for ex in exercises:
-        ex_title = ex.get("title", "Unknown")
-        ex_notes = ex.get("notes") or ""
-        sets = ex.get("sets", [])
-        sets_lines = []
-        for s in sets:
-            parts = []
-            st = s.get("type", "normal")
-            if st != "normal":
-                parts.append(f"[{st}]")
-            if s.get("weight_kg") is not None:
-                parts.append(f"{s['weight_kg']}kg")
-            if s.get("reps") is not None:
-                parts.append(f"x{s['reps']}")
-            if s.get("distance_meters") is not None:
-                parts.append(f"{s['distance_meters']}m")
-            if s.get("duration_seconds") is not None:
-                parts.append(f"{s['duration_seconds']}s")
-            sets_lines.append(" ".join(parts) if parts else "-")
-        body = "\n".join(f"  Set {i+1}: {line}" for i, line in enumerate(sets_lines))
-        if ex_notes:
-            body = f"  Note: {ex_notes}\n" + body
-        console.print(f"\n[bold cyan]{ex_title}[/bold cyan]")
-        console.print(body)
+        _print_exercise(ex, _ROUTINE_SET_FIELDS)
 
 
 # -- Exercise Templates ------------------------------------------------------
 
 
-def print_exercise_templates(data: dict) -> None:
+def print_exercise_templates(data: dict, plain: bool = False) -> None:
     templates = data.get("exercise_templates", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
-
     if not templates:
         console.print("[dim]No exercise templates found.[/dim]")
         return
 
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
     table = Table(title=f"Exercise Templates (page {page}/{page_count})")
     table.add_column("ID", style="dim", max_width=36)
     table.add_column("Title", style="bold")
@@ -241,15 +393,17 @@ def print_exercise_templates(data: dict) -> None:
     table.add_column("Primary Muscle")
     table.add_column("Custom", justify="center")
 
-    for t in templates:
-        table.add_row(
+    rows = [
+        (
             t.get("id", ""),
             t.get("title", ""),
             t.get("type", ""),
             t.get("primary_muscle_group", ""),
             "yes" if t.get("is_custom") else "",
         )
-    console.print(table)
+        for t in templates
+    ]
+    _emit(table, rows, plain)
 
 
 def print_exercise_template_detail(data: dict) -> None:
@@ -264,15 +418,14 @@ def print_exercise_template_detail(data: dict) -> None:
     console.print(Panel("\n".join(lines), title=f"Template {t.get('id', '')}", expand=False))
 
 
-def print_exercise_history(data: dict, template_id: str) -> None:
+def print_exercise_history(data: dict, template_id: str, plain: bool = False) -> None:
     entries = data.get("exercise_history", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
-
     if not entries:
         console.print("[dim]No exercise history found.[/dim]")
         return
 
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
     table = Table(title=f"Exercise History for {template_id} (page {page}/{page_count})")
     table.add_column("Workout", style="dim")
     table.add_column("Date")
@@ -281,44 +434,47 @@ def print_exercise_history(data: dict, template_id: str) -> None:
     table.add_column("Reps", justify="right")
     table.add_column("RPE", justify="right")
 
-    for e in entries:
-        table.add_row(
+    rows = [
+        (
             e.get("workout_title", ""),
             _parse_ts(e.get("workout_start_time")),
             e.get("set_type", ""),
-            str(e.get("weight_kg", "")) if e.get("weight_kg") is not None else "-",
-            str(e.get("reps", "")) if e.get("reps") is not None else "-",
-            str(e.get("rpe", "")) if e.get("rpe") is not None else "-",
+            _fmt(e.get("weight_kg")),
+            _fmt(e.get("reps")),
+            _fmt(e.get("rpe")),
         )
-    console.print(table)
+        for e in entries
+    ]
+    _emit(table, rows, plain)
 
 
 # -- Routine Folders ---------------------------------------------------------
 
 
-def print_routine_folders(data: dict) -> None:
+def print_routine_folders(data: dict, plain: bool = False) -> None:
     folders = data.get("routine_folders", [])
-    page = data.get("page", "?")
-    page_count = data.get("page_count", "?")
-
     if not folders:
         console.print("[dim]No routine folders found.[/dim]")
         return
 
+    page = data.get("page", "?")
+    page_count = data.get("page_count", "?")
     table = Table(title=f"Routine Folders (page {page}/{page_count})")
     table.add_column("ID", style="dim")
     table.add_column("Title", style="bold")
     table.add_column("Created")
     table.add_column("Updated")
 
-    for f in folders:
-        table.add_row(
+    rows = [
+        (
             str(f.get("id", "")),
             f.get("title", ""),
             _parse_ts(f.get("created_at")),
             _parse_ts(f.get("updated_at")),
         )
-    console.print(table)
+        for f in folders
+    ]
+    _emit(table, rows, plain)
 
 
 def print_routine_folder_detail(data: dict) -> None:
@@ -332,9 +488,30 @@ def print_routine_folder_detail(data: dict) -> None:
     console.print(Panel("\n".join(lines), title="Routine Folder", expand=False))
 
 
-# -- Generic JSON fallback ---------------------------------------------------
+# -- JSON output -------------------------------------------------------------
+
+def print_json_bytes(raw: bytes) -> None:
+    """Print an already-encoded JSON document.
 
-def print_json(data: Any) -> None:
-    """Fallback: pretty-print raw JSON."""
-    import json
-    console.print_json(json.dumps(data, indent=2, default=str))
+    Piped output gets the bytes as-is; a terminal still gets Rich's
+    indented, highlighted rendering.
+    """
+    if console.is_terminal:
+        console.print_json(raw.decode())
+        return
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    write(raw)
+    if not raw.endswith(b"\n"):
+        write(b"\n")
+    sys.stdout.flush()
+
+
+def print_ndjson(items: Iterable[Any]) -> None:
+    """Write one compact JSON document per line as items arrive."""
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    dumps = _json.dumps
+    for item in items:
+        write(dumps(item) + b"\n")
+    sys.stdout.flush()
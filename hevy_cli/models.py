@@ -0,0 +1,29 @@
+"""Typed Hevy API models, decoded directly from JSON with msgspec.
+
+Only the fields the display layer reads are declared; anything else in
+the payload is ignored on decode. Every field is nullable because the API
+sends ``null`` for unset values; the display layer applies the defaults.
+Requires the optional ``msgspec`` dependency.
+"""
+
+from __future__ import annotations
+
+import msgspec
+
+
+class WorkoutExercise(msgspec.Struct):
+    """Declares no fields: list pages only count a workout's exercises."""
+
+
+class Workout(msgspec.Struct):
+    id: str | None = None
+    title: str | None = None
+    start_time: str | float | None = None
+    end_time: str | float | None = None
+    exercises: list[WorkoutExercise] | None = None
+
+
+class WorkoutsPage(msgspec.Struct):
+    page: int | None = None
+    page_count: int | None = None
+    workouts: list[Workout] | None = None